@@ -1,28 +1,49 @@
+from functools import lru_cache
+
 import QuantLib as ql
 from ..utils.ql import preprocess_quotes
 
+# Inputs are quantized to this many decimals before process memoization.
+_PROCESS_KEY_DECIMALS = 4
 
-def Tree_USVanilla(u_params, steps: int = 200):
-    today = ql.Settings.instance().evaluationDate
 
+@lru_cache(maxsize=4096)
+def _build_process(u: float, div: float, r: float, sigma: float):
+    """
+    Builds (and memoizes) a Black-Scholes-Merton process for the given market
+    inputs. Rows of an option chain mostly share the same underlying price,
+    rates and binned vol, so the quotes, term structures and process are built
+    once per distinct quantized combination instead of once per row.
+    """
     calendar = ql.TARGET()
     count = ql.Actual365Fixed()
 
-    q_params = preprocess_quotes(u_params)
-
-    div_term = ql.FlatForward(0, calendar, ql.QuoteHandle(q_params["div"]), count)
-    r_term = ql.FlatForward(0, calendar, ql.QuoteHandle(q_params["r"]), count)
+    div_term = ql.FlatForward(0, calendar, ql.QuoteHandle(ql.SimpleQuote(div)), count)
+    r_term = ql.FlatForward(0, calendar, ql.QuoteHandle(ql.SimpleQuote(r)), count)
     vol_term = ql.BlackConstantVol(
-        0, calendar, ql.QuoteHandle(q_params["sigma"]), count
+        0, calendar, ql.QuoteHandle(ql.SimpleQuote(sigma)), count
     )
 
-    bsm_process = ql.BlackScholesMertonProcess(
-        ql.QuoteHandle(q_params["u"]),
+    return ql.BlackScholesMertonProcess(
+        ql.QuoteHandle(ql.SimpleQuote(u)),
         ql.YieldTermStructureHandle(div_term),
         ql.YieldTermStructureHandle(r_term),
         ql.BlackVolTermStructureHandle(vol_term),
     )
 
+
+def Tree_USVanilla(u_params, steps: int = 200):
+    today = ql.Settings.instance().evaluationDate
+
+    q_params = preprocess_quotes(u_params)
+
+    bsm_process = _build_process(
+        round(float(u_params["u"]), _PROCESS_KEY_DECIMALS),
+        round(float(u_params["div"]), _PROCESS_KEY_DECIMALS),
+        round(float(u_params["r"]), _PROCESS_KEY_DECIMALS),
+        round(float(u_params["sigma"]), _PROCESS_KEY_DECIMALS),
+    )
+
     option = ql.VanillaOption(
         ql.PlainVanillaPayoff(q_params["option_type"], q_params["k"]),
         ql.AmericanExercise(today, q_params["exercise_date"]),
@@ -30,3 +51,62 @@ def Tree_USVanilla(u_params, steps: int = 200):
 
     option.setPricingEngine(ql.BinomialVanillaEngine(bsm_process, "crr", steps=steps))
     return option, bsm_process
+
+
+class USVanillaPricer:
+    """
+    Reusable pricing context for US vanilla options.
+
+    Builds the SimpleQuotes, flat term structures, Black-Scholes-Merton process
+    and binomial engine once. Each option is then priced by mutating the quotes
+    in place, so QuantLib's observer chain lazily recomputes instead of the
+    whole stack being rebuilt per row as in Tree_USVanilla.
+    """
+
+    def __init__(self, steps: int = 200):
+        calendar = ql.TARGET()
+        count = ql.Actual365Fixed()
+
+        self.u_quote = ql.SimpleQuote(0.0)
+        self.sigma_quote = ql.SimpleQuote(0.0)
+        self.r_quote = ql.SimpleQuote(0.0)
+        self.div_quote = ql.SimpleQuote(0.0)
+
+        div_term = ql.FlatForward(0, calendar, ql.QuoteHandle(self.div_quote), count)
+        r_term = ql.FlatForward(0, calendar, ql.QuoteHandle(self.r_quote), count)
+        vol_term = ql.BlackConstantVol(
+            0, calendar, ql.QuoteHandle(self.sigma_quote), count
+        )
+
+        self.process = ql.BlackScholesMertonProcess(
+            ql.QuoteHandle(self.u_quote),
+            ql.YieldTermStructureHandle(div_term),
+            ql.YieldTermStructureHandle(r_term),
+            ql.BlackVolTermStructureHandle(vol_term),
+        )
+        self.engine = ql.BinomialVanillaEngine(self.process, "crr", steps=steps)
+
+    def implied_vol(self, params: dict, last_price: float) -> float:
+        """
+        Calculate the implied volatility of one option described by a dict with
+        the raw 'u', 'k', 'sigma', 'r', 'div', 'exercise_date' (Timestamp) and
+        'option_type' ('CALL'/'PUT') values.
+        """
+        self.u_quote.setValue(float(params["u"]))
+        self.sigma_quote.setValue(float(params["sigma"]))
+        self.r_quote.setValue(float(params["r"]))
+        self.div_quote.setValue(float(params["div"]))
+
+        exercise_date = params["exercise_date"]
+        option = ql.VanillaOption(
+            ql.PlainVanillaPayoff(
+                ql.Option.Call if params["option_type"] == "CALL" else ql.Option.Put,
+                float(params["k"]),
+            ),
+            ql.AmericanExercise(
+                ql.Settings.instance().evaluationDate,
+                ql.Date(exercise_date.day, exercise_date.month, exercise_date.year),
+            ),
+        )
+        option.setPricingEngine(self.engine)
+        return option.impliedVolatility(last_price, self.process)
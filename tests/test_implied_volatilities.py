@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+
+from src.pricing_models.analytic import _baw_price
+from src.volatility.implied_volatilities import baw_iv_newton, get_USImpliedVol
+
+
+def test_baw_iv_newton_survives_deep_otm_short_dated_put():
+    """
+    Regression: a deep-OTM short-dated put used to drive the Newton iterate
+    into a degenerate corner of the BAW formula and raise ZeroDivisionError
+    from inside the compiled kernel, aborting the whole batch. Bad rows must
+    come back as NaN (or a solved vol) with the rest of the chain intact.
+    """
+    S = np.array([100.0, 100.0, 100.0])
+    K = np.array([100.0, 90.0, 76.33])
+    T = np.array([0.5, 0.25, 0.0506])
+    r = np.full(3, 0.04)
+    q = np.full(3, 0.01)
+    price = np.array([6.0, 2.0, 0.188])
+    is_call = np.array([True, False, False])
+
+    out = baw_iv_newton(S, K, T, r, q, price, is_call)
+
+    assert out.shape == (3,)
+    # The healthy rows must solve, and every solved vol must reprice the
+    # quoted premium within the solver tolerance.
+    assert not np.isnan(out[:2]).any()
+    for i in range(3):
+        if not np.isnan(out[i]):
+            repriced = _baw_price(S[i], K[i], T[i], r[i], q[i], out[i], is_call[i])
+            assert abs(repriced - price[i]) < 1e-6
+
+
+def test_baw_price_degenerate_inputs_return_nan():
+    # Near-zero vol collapses the critical-price seed onto the strike, and a
+    # zero rate zeroes the K(t) annuity term; both must yield NaN, not raise.
+    assert np.isnan(_baw_price(100.0, 76.33, 0.0506, 0.04, 0.01, 1e-3, False))
+    assert np.isnan(_baw_price(100.0, 90.0, 0.25, 0.0, 0.01, 0.2, False))
+
+
+def test_get_usimpliedvol_default_path_handles_bad_row():
+    df = pd.DataFrame(
+        {
+            "u": [100.0, 100.0, 100.0],
+            "k": [100.0, 90.0, 76.33],
+            "time_to_maturity": [0.5, 0.25, 0.0506],
+            "r": [0.04, 0.04, 0.04],
+            "div": [0.01, 0.01, 0.01],
+            "lastPrice": [6.0, 2.0, 0.188],
+            "option_type": ["CALL", "PUT", "PUT"],
+        }
+    )
+    result = get_USImpliedVol(df, verbose=False)
+    assert not result["calculated_col"].isna().any()